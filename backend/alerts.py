@@ -1,12 +1,35 @@
 import logging
 import json
-from typing import Dict
+from typing import Dict, Optional
+
+from serialization import CachedPayload
 
 
 class AlertStore:
     def __init__(self, mock_file="./tmp/mock_cloudtrail.json"):
         self.mock_file = mock_file
         self.alerts = self._generate_sample_alerts()
+        # Alerts are immutable once generated, so their JSON is encoded at most once
+        self._payloads: Dict[str, CachedPayload] = {}
+        self._list_payload: Optional[CachedPayload] = None
+
+    def alerts_payload(self) -> CachedPayload:
+        """Serialized list of all alerts, newest first."""
+        if self._list_payload is None:
+            alerts_list = sorted(
+                self.alerts.values(), key=lambda x: x["timestamp"], reverse=True
+            )
+            self._list_payload = CachedPayload(alerts_list)
+        return self._list_payload
+
+    def alert_payload(self, alert_id: str) -> Optional[CachedPayload]:
+        """Serialized single alert, or None if it does not exist."""
+        alert = self.alerts.get(alert_id)
+        if not alert:
+            return None
+        if alert_id not in self._payloads:
+            self._payloads[alert_id] = CachedPayload(alert)
+        return self._payloads[alert_id]
 
     def _generate_sample_alerts(self) -> Dict:
         """Generate sample alerts from CloudTrail data."""
@@ -1,8 +1,9 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 from alerts import AlertStore
 
 from enrichment_service import MockAWSEnrichmentService
+from serialization import CachedPayload, available_encodings
 
 # Flask API
 app = Flask(__name__)
@@ -10,6 +11,30 @@ CORS(app)
 
 enrichment_service = MockAWSEnrichmentService()
 alert_store = AlertStore()
+for alert in alert_store.alerts.values():
+    enrichment_service.user_directory.add_alert(alert)
+    enrichment_service.ip_index.add_alert(alert)
+
+
+def json_response(payload) -> Response:
+    """Build a JSON response with ETag revalidation and gzip/brotli negotiation."""
+    if not isinstance(payload, CachedPayload):
+        payload = CachedPayload(payload)
+
+    if request.method == "GET" and request.if_none_match.contains_weak(payload.etag):
+        response = Response(status=304)
+    else:
+        encoding = request.accept_encodings.best_match(available_encodings())
+        body, encoding = payload.encode(encoding)
+        response = Response(body, mimetype="application/json")
+        if encoding:
+            response.content_encoding = encoding
+
+    # Weak, because the same ETag covers every content coding of the body
+    response.set_etag(payload.etag, weak=True)
+    response.vary.add("Accept-Encoding")
+    return response
+
 
 @app.route("/", methods=["GET"])
 def index():
@@ -28,7 +53,7 @@ def enrich_alert():
 
         enrichments = enrichment_service.enrich(user_name, alert_data)
 
-        return jsonify(enrichments)
+        return json_response(enrichments)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -36,10 +61,13 @@ def enrich_alert():
 
 @app.route("/api/users", methods=["GET"])
 def get_users():
-    """Get list of unique users in the mock data."""
+    """Get a page of user activity summaries, optionally filtered by name prefix."""
     try:
-        users = enrichment_service.get_users()
-        return jsonify(users)
+        prefix = request.args.get("prefix", "")
+        offset = max(request.args.get("offset", 0, type=int), 0)
+        limit = min(max(request.args.get("limit", 50, type=int), 1), 500)
+        users = enrichment_service.user_directory.page(prefix, offset, limit)
+        return json_response(users)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -48,10 +76,7 @@ def get_users():
 def get_alerts():
     """Get list of all alerts."""
     try:
-        # Convert alerts dict to list and sort by timestamp
-        alerts_list = list(alert_store.alerts.values())
-        alerts_list.sort(key=lambda x: x["timestamp"], reverse=True)
-        return jsonify(alerts_list)
+        return json_response(alert_store.alerts_payload())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -60,10 +85,29 @@ def get_alerts():
 def get_alert(alert_id):
     """Get specific alert details."""
     try:
-        alert = alert_store.alerts.get(alert_id)
+        alert = alert_store.alert_payload(alert_id)
         if not alert:
             return jsonify({"error": "Alert not found"}), 404
-        return jsonify(alert)
+        return json_response(alert)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/ip/<addr>", methods=["GET"])
+@app.route("/api/ip/<addr>/<int:prefixlen>", methods=["GET"])
+def get_ip_activity(addr, prefixlen=None):
+    """Get events, users and alerts seen from an address or CIDR range."""
+    try:
+        network = addr if prefixlen is None else f"{addr}/{prefixlen}"
+        try:
+            activity = enrichment_service.ip_index.lookup(network)
+        except ValueError:
+            return jsonify({"error": f"Invalid IP address or range: {network}"}), 400
+        activity["alerts"] = [
+            {k: v for k, v in alert.items() if k != "eventData"}
+            for alert in activity["alerts"]
+        ]
+        return json_response(activity)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
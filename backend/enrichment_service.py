@@ -1,5 +1,8 @@
 import json
 
+from ip_index import IpIndex
+from user_directory import UserDirectory
+
 
 class MockAWSEnrichmentService:
     def __init__(self, mock_file="tmp/mock_cloudtrail.json"):
@@ -12,10 +15,17 @@ class MockAWSEnrichmentService:
             with open(self.mock_file, "r") as f:
                 data = json.load(f)
                 self.events = data.get("Records", [])
+                self.user_directory = UserDirectory()
+                self.ip_index = IpIndex()
+                for event in self.events:
+                    self.user_directory.add_event(event)
+                    self.ip_index.add_event(event)
                 print(f"Loaded {len(self.events)} events from mock data")
         except Exception as e:
             print(f"Error loading mock data: {e}")
             self.events = []
+            self.user_directory = UserDirectory()
+            self.ip_index = IpIndex()
 
     def enrich(self, user_name: str, alert_data: dict):
         return {
@@ -23,6 +33,9 @@ class MockAWSEnrichmentService:
             "recentRoleAssumptions": self.get_recent_role_assumptions(user_name),
             "serviceInteractions": self.get_service_interactions(user_name),
             "interestingApiCalls": self.get_interesting_api_calls(user_name),
+            "otherUsersFromSourceIP": self.get_other_users_from_ip(
+                user_name, alert_data.get("sourceIP")
+            ),
         }
 
     def get_assumed_role_details(self, event: dict) -> dict:
@@ -125,10 +138,10 @@ class MockAWSEnrichmentService:
             print(f"Error in get_interesting_api_calls: {e}")
             return [{"error": str(e)}]
         
+    def get_other_users_from_ip(self, user_name: str, source_ip: str) -> int:
+        """Get the number of other users seen from the same source IP."""
+        return len(self.ip_index.users_for(source_ip) - {user_name})
+
     def get_users(self) -> list:
-        users = set()
-        for event in self.events:
-            user_name = event["userIdentity"].get("userName")
-            if user_name:
-                users.add(user_name)
-        return list(users)
\ No newline at end of file
+        """Get unique user names, most recently active first."""
+        return self.user_directory.user_names()
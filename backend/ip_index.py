@@ -0,0 +1,82 @@
+import ipaddress
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Set
+
+
+class IpIndex:
+    """Events, users and alerts keyed by source IP, supporting CIDR range lookups."""
+
+    def __init__(self):
+        # Addresses are stored as integers, one sorted key list per IP version
+        # so that IPv4 and IPv6 values never interleave.
+        self._keys: Dict[int, List[int]] = {4: [], 6: []}
+        self._entries: Dict[int, Dict[int, dict]] = {4: {}, 6: {}}
+
+    def add_event(self, event: dict):
+        """Index an event under its sourceIPAddress."""
+        entry = self._entry(event.get("sourceIPAddress"))
+        if entry is None:
+            return
+        entry["events"].append(event)
+        user_name = event["userIdentity"].get("userName")
+        if user_name:
+            entry["users"].add(user_name)
+
+    def add_alert(self, alert: dict):
+        """Index an alert under its sourceIP."""
+        entry = self._entry(alert.get("sourceIP"))
+        if entry is not None:
+            entry["alerts"].append(alert)
+
+    def users_for(self, address: str) -> Set[str]:
+        """Users seen from a single address."""
+        ip = _parse_address(address)
+        if ip is None:
+            return set()
+        entry = self._entries[ip.version].get(int(ip))
+        return set(entry["users"]) if entry else set()
+
+    def lookup(self, network: str) -> dict:
+        """Everything seen from an address or CIDR range.
+
+        Raises ValueError if network is not a valid address or range.
+        """
+        net = ipaddress.ip_network(network, strict=False)
+        keys = self._keys[net.version]
+        start = bisect_left(keys, int(net.network_address))
+        end = bisect_right(keys, int(net.broadcast_address), start)
+
+        events, alerts, users = [], [], set()
+        for key in keys[start:end]:
+            entry = self._entries[net.version][key]
+            events.extend(entry["events"])
+            alerts.extend(entry["alerts"])
+            users.update(entry["users"])
+
+        address_class = type(net.network_address)
+        return {
+            "network": str(net),
+            "addresses": [str(address_class(key)) for key in keys[start:end]],
+            "events": events,
+            "users": sorted(users),
+            "alerts": alerts,
+        }
+
+    def _entry(self, address: Optional[str]) -> Optional[dict]:
+        ip = _parse_address(address)
+        if ip is None:
+            return None
+        entries = self._entries[ip.version]
+        key = int(ip)
+        if key not in entries:
+            entries[key] = {"events": [], "users": set(), "alerts": []}
+            insort(self._keys[ip.version], key)
+        return entries[key]
+
+
+def _parse_address(address: Optional[str]):
+    # CloudTrail uses service hostnames (e.g. "ec2.amazonaws.com") for calls made by AWS services
+    try:
+        return ipaddress.ip_address(address)
+    except ValueError:
+        return None
@@ -0,0 +1,62 @@
+import gzip
+import hashlib
+import json
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Bodies smaller than this are sent as-is; compressing them costs more than it saves.
+MIN_COMPRESS_SIZE = 1024
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects a few things the stdlib accepts (e.g. non-str keys)
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def available_encodings() -> List[str]:
+    """Content codings this process can produce, most preferred first."""
+    if brotli is not None:
+        return ["br", "gzip"]
+    return ["gzip"]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress body with the given content coding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class CachedPayload:
+    """A JSON body serialized once, with its ETag and compressed variants."""
+
+    def __init__(self, obj):
+        self.body = dumps(obj)
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self._encoded: Dict[str, bytes] = {}
+
+    def encode(self, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        """Return the body for the negotiated encoding and the coding actually applied."""
+        if not encoding or len(self.body) < MIN_COMPRESS_SIZE:
+            return self.body, None
+        if encoding not in self._encoded:
+            self._encoded[encoding] = compress(self.body, encoding)
+        return self._encoded[encoding], encoding
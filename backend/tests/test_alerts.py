@@ -141,5 +141,23 @@ class TestAlertStore(unittest.TestCase):
             self.assertEqual(alert['userName'], 'Unknown')
             self.assertEqual(alert['userAgent'], 'N/A')
 
+    def test_alerts_payload_sorted_and_cached(self):
+        """Test that the serialized alert list is newest first and built once"""
+        with patch('builtins.open', mock_open(read_data=json.dumps(self.sample_data))):
+            store = AlertStore()
+            payload = store.alerts_payload()
+            alerts = json.loads(payload.body)
+            self.assertEqual([a['eventName'] for a in alerts], ['CreateBucket', 'AssumeRole'])
+            self.assertIs(store.alerts_payload(), payload)
+
+    def test_alert_payload(self):
+        """Test serialized single alerts and missing IDs"""
+        with patch('builtins.open', mock_open(read_data=json.dumps(self.sample_data))):
+            store = AlertStore()
+            payload = store.alert_payload('1')
+            self.assertEqual(json.loads(payload.body), store.alerts['1'])
+            self.assertIs(store.alert_payload('1'), payload)
+            self.assertIsNone(store.alert_payload('999'))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
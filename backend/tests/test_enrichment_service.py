@@ -93,6 +93,13 @@ class TestMockAWSEnrichmentService(unittest.TestCase):
         self.assertIn('recentRoleAssumptions', enriched)
         self.assertIn('serviceInteractions', enriched)
         self.assertIn('interestingApiCalls', enriched)
+        self.assertIn('otherUsersFromSourceIP', enriched)
+
+    def test_get_other_users_from_ip(self):
+        """Test counting other users seen from the same source IP"""
+        self.assertEqual(self.service.get_other_users_from_ip('admin-user', '32.118.234.47'), 0)
+        self.assertEqual(self.service.get_other_users_from_ip('lambda-role', '32.118.234.47'), 1)
+        self.assertEqual(self.service.get_other_users_from_ip('admin-user', None), 0)
 
     def test_get_service_interactions_empty(self):
         """Test service interactions for non-existent user"""
@@ -0,0 +1,66 @@
+import unittest
+from ip_index import IpIndex
+
+def make_event(user_name, source_ip):
+    return {
+        "eventTime": "2024-10-16T03:54:00Z",
+        "eventSource": "s3.amazonaws.com",
+        "eventName": "CreateBucket",
+        "sourceIPAddress": source_ip,
+        "userIdentity": {"userName": user_name},
+    }
+
+class TestIpIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = IpIndex()
+        for event in [
+            make_event("admin-user", "10.0.0.5"),
+            make_event("system-user", "10.0.0.5"),
+            make_event("lambda-role", "10.0.0.200"),
+            make_event("admin-user", "10.0.1.1"),
+            make_event("developer1", "2001:db8::1"),
+            make_event("lambda-role", "lambda.amazonaws.com"),
+        ]:
+            self.index.add_event(event)
+        self.index.add_alert({"id": "1", "userName": "admin-user", "sourceIP": "10.0.0.5"})
+
+    def test_single_address(self):
+        """Test lookup of one address"""
+        result = self.index.lookup("10.0.0.5")
+        self.assertEqual(result["network"], "10.0.0.5/32")
+        self.assertEqual(len(result["events"]), 2)
+        self.assertEqual(result["users"], ["admin-user", "system-user"])
+        self.assertEqual([a["id"] for a in result["alerts"]], ["1"])
+
+    def test_cidr_range(self):
+        """Test that a /24 matches only addresses inside it"""
+        result = self.index.lookup("10.0.0.0/24")
+        self.assertEqual(result["addresses"], ["10.0.0.5", "10.0.0.200"])
+        self.assertEqual(result["users"], ["admin-user", "lambda-role", "system-user"])
+        self.assertEqual(len(self.index.lookup("10.0.0.0/16")["events"]), 4)
+
+    def test_host_bits_ignored(self):
+        """Test that ranges with host bits set are normalized"""
+        self.assertEqual(self.index.lookup("10.0.0.77/24")["network"], "10.0.0.0/24")
+
+    def test_ipv6(self):
+        """Test that IPv6 addresses are indexed separately from IPv4"""
+        result = self.index.lookup("2001:db8::/32")
+        self.assertEqual(result["addresses"], ["2001:db8::1"])
+        self.assertEqual(result["users"], ["developer1"])
+        self.assertEqual(self.index.lookup("0.0.0.0/0")["users"], ["admin-user", "lambda-role", "system-user"])
+
+    def test_invalid_network(self):
+        """Test that malformed queries raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.index.lookup("not-an-ip")
+
+    def test_users_for(self):
+        """Test users seen from an address, ignoring non-IP sources"""
+        self.assertEqual(self.index.users_for("10.0.0.5"), {"admin-user", "system-user"})
+        self.assertEqual(self.index.users_for("192.168.0.1"), set())
+        self.assertEqual(self.index.users_for("lambda.amazonaws.com"), set())
+        self.assertEqual(self.index.users_for(None), set())
+
+if __name__ == '__main__':
+    unittest.main()
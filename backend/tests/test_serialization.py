@@ -0,0 +1,63 @@
+import unittest
+import gzip
+import json
+from unittest.mock import patch
+import serialization
+from serialization import CachedPayload, compress, dumps
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self.payload = {
+            "id": "1",
+            "eventData": {
+                "userIdentity": {"type": "AssumedRole", "userName": "admin-user"},
+                "responseElements": {},
+            },
+        }
+
+    def test_dumps_round_trip(self):
+        """Test that dumps produces JSON bytes equivalent to the input"""
+        body = dumps(self.payload)
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), self.payload)
+
+    def test_dumps_stdlib_fallback(self):
+        """Test that dumps works when orjson is not installed"""
+        with patch.object(serialization, 'orjson', None):
+            body = dumps(self.payload)
+        self.assertEqual(json.loads(body), self.payload)
+
+    def test_gzip_compress(self):
+        """Test gzip compression round trip"""
+        body = dumps(self.payload)
+        self.assertEqual(gzip.decompress(compress(body, 'gzip')), body)
+
+    def test_unsupported_encoding(self):
+        """Test that unknown encodings are rejected"""
+        with self.assertRaises(ValueError):
+            compress(b'{}', 'deflate')
+
+    def test_etag_is_stable(self):
+        """Test that equal payloads share an ETag and different ones do not"""
+        self.assertEqual(CachedPayload(self.payload).etag, CachedPayload(self.payload).etag)
+        self.assertNotEqual(CachedPayload(self.payload).etag, CachedPayload({}).etag)
+
+    def test_small_body_not_compressed(self):
+        """Test that bodies below the threshold are sent uncompressed"""
+        payload = CachedPayload(self.payload)
+        body, encoding = payload.encode('gzip')
+        self.assertEqual(body, payload.body)
+        self.assertIsNone(encoding)
+
+    def test_large_body_compressed_once(self):
+        """Test that compressed variants are cached per encoding"""
+        payload = CachedPayload([self.payload] * 100)
+        body, encoding = payload.encode('gzip')
+        self.assertEqual(encoding, 'gzip')
+        self.assertEqual(gzip.decompress(body), payload.body)
+        with patch.object(serialization, 'compress') as mock_compress:
+            self.assertIs(payload.encode('gzip')[0], body)
+            mock_compress.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from user_directory import UserDirectory
+
+def make_event(user_name, event_time, source="s3.amazonaws.com", error_code=None):
+    event = {
+        "eventTime": event_time,
+        "eventSource": source,
+        "eventName": "PutObject",
+        "userIdentity": {"userName": user_name} if user_name else {},
+    }
+    if error_code:
+        event["errorCode"] = error_code
+    return event
+
+class TestUserDirectory(unittest.TestCase):
+    def setUp(self):
+        self.directory = UserDirectory()
+        for event in [
+            make_event("admin-user", "2024-10-16T03:54:00Z", "rds.amazonaws.com"),
+            make_event("system-user", "2024-10-16T04:20:00Z"),
+            make_event("admin-user", "2024-10-16T07:31:00Z", error_code="AccessDenied"),
+            make_event("admin-user", "2024-10-16T01:00:00Z"),
+            make_event("lambda-role", "2024-10-16T05:00:00Z", "lambda.amazonaws.com"),
+            make_event(None, "2024-10-16T09:00:00Z"),
+        ]:
+            self.directory.add_event(event)
+
+    def test_summary(self):
+        """Test that per-user counters and time range are maintained"""
+        self.directory.add_alert({"userName": "admin-user"})
+        user = self.directory.page(prefix="admin")["users"][0]
+        self.assertEqual(user["userName"], "admin-user")
+        self.assertEqual(user["eventCount"], 3)
+        self.assertEqual(user["firstSeen"], "2024-10-16T01:00:00Z")
+        self.assertEqual(user["lastSeen"], "2024-10-16T07:31:00Z")
+        self.assertEqual(user["services"], ["rds", "s3"])
+        self.assertEqual(user["failureCount"], 1)
+        self.assertEqual(user["alertCount"], 1)
+
+    def test_events_without_user_ignored(self):
+        """Test that events with no userName are not counted"""
+        self.assertEqual(len(self.directory), 3)
+
+    def test_alert_for_unknown_user_ignored(self):
+        """Test that alerts for users never seen in events are dropped"""
+        self.directory.add_alert({"userName": "Unknown"})
+        self.assertEqual(len(self.directory), 3)
+
+    def test_user_names_by_last_activity(self):
+        """Test that users are ordered most recently active first"""
+        self.assertEqual(
+            self.directory.user_names(), ["admin-user", "lambda-role", "system-user"]
+        )
+
+    def test_pagination(self):
+        """Test offset and limit over the activity ordering"""
+        page = self.directory.page(offset=1, limit=1)
+        self.assertEqual(page["total"], 3)
+        self.assertEqual([u["userName"] for u in page["users"]], ["lambda-role"])
+        self.assertEqual(self.directory.page(offset=5)["users"], [])
+
+    def test_prefix_search(self):
+        """Test prefix filtering keeps the activity ordering"""
+        self.directory.add_event(make_event("system-admin", "2024-10-17T00:00:00Z"))
+        page = self.directory.page(prefix="system")
+        self.assertEqual(page["total"], 2)
+        self.assertEqual(
+            [u["userName"] for u in page["users"]], ["system-admin", "system-user"]
+        )
+        self.assertEqual(self.directory.page(prefix="nobody")["users"], [])
+
+if __name__ == '__main__':
+    unittest.main()
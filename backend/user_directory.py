@@ -0,0 +1,89 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+
+class UserDirectory:
+    """Per-user activity summaries, kept up to date as events and alerts are ingested."""
+
+    def __init__(self):
+        self._users: Dict[str, dict] = {}
+        # (lastSeen, userName) ascending, so the most recently active users are at the end
+        self._by_activity: List[Tuple[str, str]] = []
+        # User names ascending, for prefix search
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def add_event(self, event: dict):
+        """Fold a CloudTrail event into its user's summary."""
+        user_name = event["userIdentity"].get("userName")
+        if not user_name:
+            return
+
+        event_time = event["eventTime"]
+        user = self._users.get(user_name)
+        if user is None:
+            user = {
+                "userName": user_name,
+                "eventCount": 0,
+                "firstSeen": event_time,
+                "lastSeen": event_time,
+                "services": set(),
+                "failureCount": 0,
+                "alertCount": 0,
+            }
+            self._users[user_name] = user
+            insort(self._names, user_name)
+            insort(self._by_activity, (event_time, user_name))
+        elif event_time > user["lastSeen"]:
+            self._by_activity.pop(
+                bisect_left(self._by_activity, (user["lastSeen"], user_name))
+            )
+            insort(self._by_activity, (event_time, user_name))
+            user["lastSeen"] = event_time
+
+        user["firstSeen"] = min(user["firstSeen"], event_time)
+        user["eventCount"] += 1
+        user["services"].add(event["eventSource"].split(".")[0])
+        if event.get("errorCode"):
+            user["failureCount"] += 1
+
+    def add_alert(self, alert: dict):
+        """Count an alert against its user, if the user has been seen."""
+        user = self._users.get(alert.get("userName"))
+        if user is not None:
+            user["alertCount"] += 1
+
+    def user_names(self) -> List[str]:
+        """All user names, most recently active first."""
+        return [user_name for _, user_name in reversed(self._by_activity)]
+
+    def page(self, prefix: str = "", offset: int = 0, limit: int = 50) -> dict:
+        """Return a page of user summaries, most recently active first.
+
+        Without a prefix this only touches the requested page. With one, the
+        matching names are found by bisection and only those are ordered.
+        """
+        if prefix:
+            start = bisect_left(self._names, prefix)
+            end = bisect_left(self._names, prefix + "\uffff", start)
+            matches = sorted(
+                (self._users[name]["lastSeen"], name) for name in self._names[start:end]
+            )
+        else:
+            matches = self._by_activity
+
+        total = len(matches)
+        stop = max(total - offset, 0)
+        page = matches[max(stop - limit, 0):stop]
+        return {
+            "users": [self._summary(user_name) for _, user_name in reversed(page)],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+        }
+
+    def _summary(self, user_name: str) -> dict:
+        user = self._users[user_name]
+        return {**user, "services": sorted(user["services"])}
@@ -42,4 +42,5 @@ export type Enrichments = {
 	serviceInteractions: {
 		[key: string]: number;
 	};
+	otherUsersFromSourceIP: number;
 };